@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Container
 import json
 import logging
 
@@ -228,7 +228,7 @@ def init_entity_id_from_config(hass, entity, config, entity_id_format):
 class MqttAttributes(Entity):
     """Mixin used for platforms that support JSON attributes."""
 
-    _attributes_extra_blocked: frozenset[str] = frozenset()
+    _attributes_extra_blocked: Container[str] = frozenset()
 
     def __init__(self, config: dict) -> None:
         """Initialize the JSON attributes mixin."""
@@ -48,11 +48,9 @@ CONF_EXPIRE_AFTER = "expire_after"
 CONF_LAST_RESET_TOPIC = "last_reset_topic"
 CONF_LAST_RESET_VALUE_TEMPLATE = "last_reset_value_template"
 
-MQTT_SENSOR_ATTRIBUTES_BLOCKED = frozenset(
-    {
-        sensor.ATTR_LAST_RESET,
-        sensor.ATTR_STATE_CLASS,
-    }
+MQTT_SENSOR_ATTRIBUTES_BLOCKED = (
+    sensor.ATTR_LAST_RESET,
+    sensor.ATTR_STATE_CLASS,
 )
 
 DEFAULT_NAME = "MQTT Sensor"
@@ -159,6 +157,11 @@ class MqttSensor(MqttEntity, SensorEntity):
 
     def _setup_from_config(self, config):
         """(Re)Setup the entity."""
+        self._device_class = config.get(CONF_DEVICE_CLASS)
+        self._parse_datetime = self._device_class in (
+            DEVICE_CLASS_DATE,
+            DEVICE_CLASS_TIMESTAMP,
+        )
         template = self._config.get(CONF_VALUE_TEMPLATE)
         if template is not None:
             template.hass = self.hass
@@ -199,15 +202,12 @@ class MqttSensor(MqttEntity, SensorEntity):
                     variables=variables,
                 )
 
-            if payload is not None and self.device_class in (
-                DEVICE_CLASS_DATE,
-                DEVICE_CLASS_TIMESTAMP,
-            ):
+            if self._parse_datetime and payload is not None:
                 if (payload := dt_util.parse_datetime(payload)) is None:
                     _LOGGER.warning(
                         "Invalid state message '%s' from '%s'", msg.payload, msg.topic
                     )
-                elif self.device_class == DEVICE_CLASS_DATE:
+                elif self._device_class == DEVICE_CLASS_DATE:
                     payload = payload.date()
 
             self._state = payload
@@ -300,7 +300,7 @@ class MqttSensor(MqttEntity, SensorEntity):
     @property
     def device_class(self) -> str | None:
         """Return the device class of the sensor."""
-        return self._config.get(CONF_DEVICE_CLASS)
+        return self._device_class
 
     @property
     def state_class(self) -> str | None:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
+import sys
 from typing import Final
 
 from homeassistant.components.sensor import (
@@ -45,16 +46,16 @@ ATTR_HECA_HUMIDITY: Final = "heca_humidity"
 ATTR_HECA_TEMPERATURE: Final = "heca_temperature"
 ATTR_MHZ14A_CARBON_DIOXIDE: Final = "mhz14a_carbon_dioxide"
 ATTR_SDS011: Final = "sds011"
-ATTR_SDS011_P1: Final = f"{ATTR_SDS011}{SUFFIX_P1}"
-ATTR_SDS011_P2: Final = f"{ATTR_SDS011}{SUFFIX_P2}"
+ATTR_SDS011_P1: Final = sys.intern(f"{ATTR_SDS011}{SUFFIX_P1}")
+ATTR_SDS011_P2: Final = sys.intern(f"{ATTR_SDS011}{SUFFIX_P2}")
 ATTR_SHT3X_HUMIDITY: Final = "sht3x_humidity"
 ATTR_SHT3X_TEMPERATURE: Final = "sht3x_temperature"
 ATTR_SIGNAL_STRENGTH: Final = "signal"
 ATTR_SPS30: Final = "sps30"
-ATTR_SPS30_P0: Final = f"{ATTR_SPS30}{SUFFIX_P0}"
-ATTR_SPS30_P1: Final = f"{ATTR_SPS30}{SUFFIX_P1}"
-ATTR_SPS30_P2: Final = f"{ATTR_SPS30}{SUFFIX_P2}"
-ATTR_SPS30_P4: Final = f"{ATTR_SPS30}{SUFFIX_P4}"
+ATTR_SPS30_P0: Final = sys.intern(f"{ATTR_SPS30}{SUFFIX_P0}")
+ATTR_SPS30_P1: Final = sys.intern(f"{ATTR_SPS30}{SUFFIX_P1}")
+ATTR_SPS30_P2: Final = sys.intern(f"{ATTR_SPS30}{SUFFIX_P2}")
+ATTR_SPS30_P4: Final = sys.intern(f"{ATTR_SPS30}{SUFFIX_P4}")
 ATTR_UPTIME: Final = "uptime"
 
 DEFAULT_NAME: Final = "Nettigo Air Monitor"
@@ -1,7 +1,7 @@
 """API for Google Nest Device Access bound to Home Assistant OAuth."""
 
 import datetime
-from typing import cast
+import time
 
 from aiohttp import ClientSession
 from google.oauth2.credentials import Credentials
@@ -41,12 +41,27 @@ class AsyncConfigEntryAuth(AbstractAuth):
         self._oauth_session = oauth_session
         self._client_id = client_id
         self._client_secret = client_secret
+        # Most recent access token and when it expires, to skip the session
+        # token lookups on every API request
+        self._access_token: str | None = None
+        self._access_token_expires_at: float = 0.0
+        # Credentials built for the most recent access token
+        self._creds: Credentials | None = None
 
     async def async_get_access_token(self) -> str:
         """Return a valid access token for SDM API."""
+        if self._access_token is not None and (
+            self._access_token_expires_at
+            > time.time() + config_entry_oauth2_flow.CLOCK_OUT_OF_SYNC_MAX_SEC
+        ):
+            return self._access_token
         if not self._oauth_session.valid_token:
             await self._oauth_session.async_ensure_token_valid()
-        return cast(str, self._oauth_session.token["access_token"])
+        token = self._oauth_session.token
+        access_token: str = token["access_token"]
+        self._access_token = access_token
+        self._access_token_expires_at = token["expires_at"]
+        return access_token
 
     async def async_get_creds(self) -> Credentials:
         """Return an OAuth credential for Pub/Sub Subscriber."""
@@ -57,6 +72,8 @@ class AsyncConfigEntryAuth(AbstractAuth):
         # even when it is expired to fully hand off this responsibility and
         # know it is working at startup (then if not, fail loudly).
         token = self._oauth_session.token
+        if self._creds is not None and self._creds.token == token["access_token"]:
+            return self._creds
         creds = Credentials(
             token=token["access_token"],
             refresh_token=token["refresh_token"],
@@ -66,6 +83,7 @@ class AsyncConfigEntryAuth(AbstractAuth):
             scopes=SDM_SCOPES,
         )
         creds.expiry = datetime.datetime.fromtimestamp(token["expires_at"])
+        self._creds = creds
         return creds
 
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 import datetime
+from functools import lru_cache
 import logging
 from pathlib import Path
 from typing import Any
@@ -26,7 +27,6 @@ from homeassistant.components.ffmpeg import async_get_image
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util.dt import utcnow
@@ -41,6 +41,15 @@ PLACEHOLDER = Path(__file__).parent / "placeholder.png"
 # Used to schedule an alarm to refresh the stream before expiration
 STREAM_EXPIRATION_BUFFER = datetime.timedelta(seconds=30)
 
+# Devices with any of these traits are exposed as a camera
+CAMERA_DEVICE_TRAITS = frozenset({CameraImageTrait.NAME, CameraLiveStreamTrait.NAME})
+
+
+@lru_cache(maxsize=1)
+def _placeholder_image() -> bytes:
+    """Return the placeholder image, shared by all cameras."""
+    return PLACEHOLDER.read_bytes()
+
 
 async def async_setup_sdm_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -55,14 +64,11 @@ async def async_setup_sdm_entry(
 
     # Fetch initial data so we have data when entities subscribe.
 
-    entities = []
-    for device in device_manager.devices.values():
-        if (
-            CameraImageTrait.NAME in device.traits
-            or CameraLiveStreamTrait.NAME in device.traits
-        ):
-            entities.append(NestCamera(device))
-    async_add_entities(entities)
+    async_add_entities(
+        NestCamera(device)
+        for device in device_manager.devices.values()
+        if not CAMERA_DEVICE_TRAITS.isdisjoint(device.traits)
+    )
 
 
 class NestCamera(Camera):
@@ -73,84 +79,55 @@ class NestCamera(Camera):
         super().__init__()
         self._device = device
         self._device_info = NestDeviceInfo(device)
+        # The API "name" field is a unique device identifier.
+        self._attr_unique_id = f"{device.name}-camera"
+        self._attr_device_info = self._device_info.device_info
+        self._attr_brand = self._device_info.device_brand
+        self._attr_model = self._device_info.device_model
         self._stream: RtspStream | None = None
         self._stream_refresh_unsub: Callable[[], None] | None = None
         # Cache of most recent event image
-        self._event_id: str | None = None
+        self._event: ImageEventBase | None = None
         self._event_image_bytes: bytes | None = None
         self._event_image_cleanup_unsub: Callable[[], None] | None = None
-        self._attr_is_streaming = CameraLiveStreamTrait.NAME in self._device.traits
-        self._placeholder_image: bytes | None = None
-
-    @property
-    def should_poll(self) -> bool:
-        """Disable polling since entities have state pushed via pubsub."""
-        return False
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        # The API "name" field is a unique device identifier.
-        return f"{self._device.name}-camera"
+        # Traits are fixed for the lifetime of the device, so resolve the
+        # camera capabilities once
+        self._has_event_image_trait = CameraEventImageTrait.NAME in device.traits
+        self._live_stream_trait: CameraLiveStreamTrait | None = device.traits.get(
+            CameraLiveStreamTrait.NAME
+        )
+        self._attr_is_streaming = self._live_stream_trait is not None
+        self._attr_frontend_stream_type = None
+        if self._live_stream_trait:
+            self._attr_supported_features = SUPPORT_STREAM
+            if StreamingProtocol.WEB_RTC in self._live_stream_trait.supported_protocols:
+                self._attr_frontend_stream_type = STREAM_TYPE_WEB_RTC
+            else:
+                self._attr_frontend_stream_type = STREAM_TYPE_HLS
 
     @property
     def name(self) -> str | None:
         """Return the name of the camera."""
         return self._device_info.device_name
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device specific attributes."""
-        return self._device_info.device_info
-
-    @property
-    def brand(self) -> str | None:
-        """Return the camera brand."""
-        return self._device_info.device_brand
-
-    @property
-    def model(self) -> str | None:
-        """Return the camera model."""
-        return self._device_info.device_model
-
-    @property
-    def supported_features(self) -> int:
-        """Flag supported features."""
-        supported_features = 0
-        if CameraLiveStreamTrait.NAME in self._device.traits:
-            supported_features |= SUPPORT_STREAM
-        return supported_features
-
-    @property
-    def frontend_stream_type(self) -> str | None:
-        """Return the type of stream supported by this camera."""
-        if CameraLiveStreamTrait.NAME not in self._device.traits:
-            return None
-        trait = self._device.traits[CameraLiveStreamTrait.NAME]
-        if StreamingProtocol.WEB_RTC in trait.supported_protocols:
-            return STREAM_TYPE_WEB_RTC
-        return STREAM_TYPE_HLS
-
     async def stream_source(self) -> str | None:
         """Return the source of the stream."""
-        if not self.supported_features & SUPPORT_STREAM:
-            return None
-        if CameraLiveStreamTrait.NAME not in self._device.traits:
-            return None
-        trait = self._device.traits[CameraLiveStreamTrait.NAME]
-        if StreamingProtocol.RTSP not in trait.supported_protocols:
-            return None
-        if not self._stream:
+        # An active stream is kept valid by the refresh alarm, so reuse it
+        # without re-checking the device capabilities
+        if not (stream := self._stream):
+            if not (trait := self._live_stream_trait):
+                return None
+            if StreamingProtocol.RTSP not in trait.supported_protocols:
+                return None
             _LOGGER.debug("Fetching stream url")
             try:
-                self._stream = await trait.generate_rtsp_stream()
+                stream = self._stream = await trait.generate_rtsp_stream()
             except GoogleNestException as err:
                 raise HomeAssistantError(f"Nest API error: {err}") from err
             self._schedule_stream_refresh()
-        assert self._stream
-        if self._stream.expires_at < utcnow():
+        if stream.expires_at < utcnow():
             _LOGGER.warning("Stream already expired")
-        return self._stream.rtsp_stream_url
+        return stream.rtsp_stream_url
 
     def _schedule_stream_refresh(self) -> None:
         """Schedules an alarm to refresh the stream url before expiration."""
@@ -194,7 +171,7 @@ class NestCamera(Camera):
             await self._stream.stop_rtsp_stream()
         if self._stream_refresh_unsub:
             self._stream_refresh_unsub()
-        self._event_id = None
+        self._event = None
         self._event_image_bytes = None
         if self._event_image_cleanup_unsub is not None:
             self._event_image_cleanup_unsub()
@@ -220,16 +197,14 @@ class NestCamera(Camera):
                 return None
             # Nest Web RTC cams only have image previews for events, and not
             # for "now" by design to save batter, and need a placeholder.
-            if not self._placeholder_image:
-                self._placeholder_image = await self.hass.async_add_executor_job(
-                    PLACEHOLDER.read_bytes
-                )
-            return self._placeholder_image
+            if _placeholder_image.cache_info().currsize:
+                return _placeholder_image()
+            return await self.hass.async_add_executor_job(_placeholder_image)
         return await async_get_image(self.hass, stream_url, output_format=IMAGE_JPEG)
 
     async def _async_active_event_image(self) -> bytes | None:
         """Return image from any active events happening."""
-        if CameraEventImageTrait.NAME not in self._device.traits:
+        if not self._has_event_image_trait:
             return None
         if not (trait := self._device.active_event_trait):
             return None
@@ -239,13 +214,13 @@ class NestCamera(Camera):
         event: ImageEventBase | None = trait.last_event
         if not event:
             return None
-        if self._event_id is not None and self._event_id == event.event_id:
+        if self._event is event:
             return self._event_image_bytes
         _LOGGER.debug("Generating event image URL for event_id %s", event.event_id)
         image_bytes = await self._async_fetch_active_event_image(trait)
         if image_bytes is None:
             return None
-        self._event_id = event.event_id
+        self._event = event
         self._event_image_bytes = image_bytes
         self._schedule_event_image_cleanup(event.expires_at)
         return image_bytes
@@ -272,6 +247,10 @@ class NestCamera(Camera):
         """Schedules an alarm to remove the image bytes from memory, honoring expiration."""
         if self._event_image_cleanup_unsub is not None:
             self._event_image_cleanup_unsub()
+        if point_in_time <= utcnow():
+            # Event expired while the image was being fetched
+            self._handle_event_image_cleanup(None)
+            return
         self._event_image_cleanup_unsub = async_track_point_in_utc_time(
             self.hass,
             self._handle_event_image_cleanup,
@@ -280,13 +259,14 @@ class NestCamera(Camera):
 
     def _handle_event_image_cleanup(self, now: Any) -> None:
         """Clear images cached from events and scheduled callback."""
-        self._event_id = None
+        self._event = None
         self._event_image_bytes = None
         self._event_image_cleanup_unsub = None
 
     async def async_handle_web_rtc_offer(self, offer_sdp: str) -> str:
         """Return the source of the stream."""
-        trait: CameraLiveStreamTrait = self._device.traits[CameraLiveStreamTrait.NAME]
+        trait = self._live_stream_trait
+        assert trait
         try:
             stream = await trait.generate_web_rtc_stream(offer_sdp)
         except GoogleNestException as err:
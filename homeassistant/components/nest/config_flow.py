@@ -30,6 +30,13 @@ from .const import DATA_SDM, DOMAIN, OOB_REDIRECT_URI, SDM_SCOPES
 DATA_FLOW_IMPL = "nest_flow_implementation"
 _LOGGER = logging.getLogger(__name__)
 
+EXTRA_AUTHORIZE_DATA = {
+    "scope": " ".join(SDM_SCOPES),
+    # Add params to ensure we get back a refresh token
+    "access_type": "offline",
+    "prompt": "consent",
+}
+
 
 @callback
 def register_flow_implementation(
@@ -57,6 +64,13 @@ def register_flow_implementation(
     }
 
 
+def _load_legacy_tokens(config_path: str) -> list[Any] | dict[Any, Any] | None:
+    """Load the legacy token cache, if present."""
+    if not os.path.isfile(config_path):
+        return None
+    return load_json(config_path)
+
+
 class NestAuthError(HomeAssistantError):
     """Base class for Nest auth errors."""
 
@@ -82,6 +96,8 @@ class NestFlowHandler(
         super().__init__()
         # When invoked for reauth, allows updating an existing config entry
         self._reauth = False
+        # Legacy API authorize url, generated once per flow
+        self._authorize_url: str | None = None
 
     @classmethod
     def register_sdm_api(cls, hass: HomeAssistant) -> None:
@@ -97,17 +113,12 @@ class NestFlowHandler(
     @property
     def logger(self) -> logging.Logger:
         """Return logger."""
-        return logging.getLogger(__name__)
+        return _LOGGER
 
     @property
     def extra_authorize_data(self) -> dict[str, str]:
         """Extra data that needs to be appended to the authorize url."""
-        return {
-            "scope": " ".join(SDM_SCOPES),
-            # Add params to ensure we get back a refresh token
-            "access_type": "offline",
-            "prompt": "consent",
-        }
+        return EXTRA_AUTHORIZE_DATA
 
     async def async_oauth_create_entry(self, data: dict[str, Any]) -> FlowResult:
         """Create an entry for the SDM flow."""
@@ -119,16 +130,13 @@ class NestFlowHandler(
         # added before the "single_instance_allowed" check was added
         existing_entries = self._async_current_entries()
         if existing_entries:
-            updated = False
-            for entry in existing_entries:
-                if updated:
-                    await self.hass.config_entries.async_remove(entry.entry_id)
-                    continue
-                updated = True
-                self.hass.config_entries.async_update_entry(
-                    entry, data=data, unique_id=DOMAIN
-                )
-                await self.hass.config_entries.async_reload(entry.entry_id)
+            entry, *stale_entries = existing_entries
+            for stale_entry in stale_entries:
+                await self.hass.config_entries.async_remove(stale_entry.entry_id)
+            self.hass.config_entries.async_update_entry(
+                entry, data=data, unique_id=DOMAIN
+            )
+            await self.hass.config_entries.async_reload(entry.entry_id)
             return self.async_abort(reason="reauth_successful")
 
         return await super().async_oauth_create_entry(data)
@@ -214,7 +222,7 @@ class NestFlowHandler(
             return self.async_abort(reason="missing_configuration")
 
         if len(flows) == 1:
-            self.flow_impl = list(flows)[0]
+            self.flow_impl = next(iter(flows))
             return await self.async_step_link()
 
         if user_input is not None:
@@ -259,18 +267,19 @@ class NestFlowHandler(
                 errors["code"] = "internal_error"
                 _LOGGER.exception("Unexpected error resolving code")
 
-        try:
-            async with async_timeout.timeout(10):
-                url = await flow["gen_authorize_url"](self.flow_id)
-        except asyncio.TimeoutError:
-            return self.async_abort(reason="authorize_url_timeout")
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception("Unexpected error generating auth url")
-            return self.async_abort(reason="unknown_authorize_url_generation")
+        if self._authorize_url is None:
+            try:
+                async with async_timeout.timeout(10):
+                    self._authorize_url = await flow["gen_authorize_url"](self.flow_id)
+            except asyncio.TimeoutError:
+                return self.async_abort(reason="authorize_url_timeout")
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected error generating auth url")
+                return self.async_abort(reason="unknown_authorize_url_generation")
 
         return self.async_show_form(
             step_id="link",
-            description_placeholders={"url": url},
+            description_placeholders={"url": self._authorize_url},
             data_schema=vol.Schema({vol.Required("code"): str}),
             errors=errors,
         )
@@ -284,12 +293,14 @@ class NestFlowHandler(
 
         config_path = info["nest_conf_path"]
 
-        if not await self.hass.async_add_executor_job(os.path.isfile, config_path):
+        tokens = await self.hass.async_add_executor_job(
+            _load_legacy_tokens, config_path
+        )
+        if tokens is None:
             self.flow_impl = DOMAIN  # type: ignore
             return await self.async_step_link()
 
         flow = self.hass.data[DATA_FLOW_IMPL][DOMAIN]
-        tokens = await self.hass.async_add_executor_job(load_json, config_path)
 
         return self._entry_from_tokens(
             "Nest (import from configuration.yaml)", flow, tokens
@@ -1,7 +1,7 @@
 """Local Nest authentication for the legacy api."""
-import asyncio
 from functools import partial
 from http import HTTPStatus
+import logging
 
 from nest.nest import AUTHORIZE_URL, AuthorizationError, NestAuth
 
@@ -10,6 +10,8 @@ from homeassistant.core import callback
 from ..config_flow import CodeInvalid, NestAuthError, register_flow_implementation
 from .const import DOMAIN
 
+_LOGGER = logging.getLogger(__name__)
+
 
 @callback
 def initialize(hass, client_id, client_secret):
@@ -31,20 +33,27 @@ async def generate_auth_url(client_id, flow_id):
 async def resolve_auth_code(hass, client_id, client_secret, code):
     """Resolve an authorization code."""
 
-    result = asyncio.Future()
+    result = hass.loop.create_future()
     auth = NestAuth(
         client_id=client_id,
         client_secret=client_secret,
-        auth_callback=result.set_result,
+        # The callback runs in the executor thread that performs the login
+        auth_callback=partial(hass.loop.call_soon_threadsafe, result.set_result),
     )
     auth.pin = code
 
+    _LOGGER.debug("Exchanging authorization code for access token")
     try:
         await hass.async_add_executor_job(auth.login)
-        return await result
+        tokens = await result
     except AuthorizationError as err:
+        _LOGGER.debug(
+            "Authorization code exchange failed: %s", err.response.status_code
+        )
         if err.response.status_code == HTTPStatus.UNAUTHORIZED:
             raise CodeInvalid() from err
         raise NestAuthError(
             f"Unknown error: {err} ({err.response.status_code})"
         ) from err
+    _LOGGER.debug("Authorization code exchange succeeded")
+    return tokens
@@ -12,23 +12,24 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     coordinator: NexiaDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     nexia_home = coordinator.nexia_home
 
-    entities = []
-    for thermostat_id in nexia_home.get_thermostat_ids():
-        thermostat = nexia_home.get_thermostat_by_id(thermostat_id)
-        entities.append(
-            NexiaBinarySensor(
-                coordinator, thermostat, "is_blower_active", "Blower Active"
-            )
+    thermostats = [
+        nexia_home.get_thermostat_by_id(thermostat_id)
+        for thermostat_id in nexia_home.get_thermostat_ids()
+    ]
+    entities = [
+        NexiaBinarySensor(coordinator, thermostat, "is_blower_active", "Blower Active")
+        for thermostat in thermostats
+    ]
+    entities.extend(
+        NexiaBinarySensor(
+            coordinator,
+            thermostat,
+            "is_emergency_heat_active",
+            "Emergency Heat Active",
         )
-        if thermostat.has_emergency_heat():
-            entities.append(
-                NexiaBinarySensor(
-                    coordinator,
-                    thermostat,
-                    "is_emergency_heat_active",
-                    "Emergency Heat Active",
-                )
-            )
+        for thermostat in thermostats
+        if thermostat.has_emergency_heat()
+    )
 
     async_add_entities(entities, True)
 
@@ -44,10 +45,10 @@ class NexiaBinarySensor(NexiaThermostatEntity, BinarySensorEntity):
             name=f"{thermostat.get_name()} {sensor_name}",
             unique_id=f"{thermostat.thermostat_id}_{sensor_call}",
         )
-        self._call = sensor_call
+        self._getter = getattr(thermostat, sensor_call)
         self._state = None
 
     @property
     def is_on(self):
         """Return the status of the sensor."""
-        return getattr(self._thermostat, self._call)()
+        return self._getter()
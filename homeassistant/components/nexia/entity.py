@@ -11,7 +11,6 @@ from .const import (
     SIGNAL_THERMOSTAT_UPDATE,
     SIGNAL_ZONE_UPDATE,
 )
-from .coordinator import NexiaDataUpdateCoordinator
 
 
 class NexiaEntity(CoordinatorEntity):
@@ -48,18 +47,13 @@ class NexiaThermostatEntity(NexiaEntity):
         """Initialize the entity."""
         super().__init__(coordinator, name, unique_id)
         self._thermostat = thermostat
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device_info of the device."""
-        assert isinstance(self.coordinator, NexiaDataUpdateCoordinator)
-        return DeviceInfo(
-            configuration_url=self.coordinator.nexia_home.root_url,
-            identifiers={(DOMAIN, self._thermostat.thermostat_id)},
+        self._attr_device_info = DeviceInfo(
+            configuration_url=coordinator.nexia_home.root_url,
+            identifiers={(DOMAIN, thermostat.thermostat_id)},
             manufacturer=MANUFACTURER,
-            model=self._thermostat.get_model(),
-            name=self._thermostat.get_name(),
-            sw_version=self._thermostat.get_firmware(),
+            model=thermostat.get_model(),
+            name=thermostat.get_name(),
+            sw_version=thermostat.get_firmware(),
         )
 
     async def async_added_to_hass(self):
@@ -81,21 +75,15 @@ class NexiaThermostatZoneEntity(NexiaThermostatEntity):
         """Initialize the entity."""
         super().__init__(coordinator, zone.thermostat, name, unique_id)
         self._zone = zone
-
-    @property
-    def device_info(self):
-        """Return the device_info of the device."""
-        data = super().device_info
-        zone_name = self._zone.get_name()
-        data.update(
+        zone_name = zone.get_name()
+        self._attr_device_info.update(
             {
-                "identifiers": {(DOMAIN, self._zone.zone_id)},
+                "identifiers": {(DOMAIN, zone.zone_id)},
                 "name": zone_name,
                 "suggested_area": zone_name,
-                "via_device": (DOMAIN, self._zone.thermostat.thermostat_id),
+                "via_device": (DOMAIN, zone.thermostat.thermostat_id),
             }
         )
-        return data
 
     async def async_added_to_hass(self):
         """Listen for signals for services."""
@@ -93,8 +93,9 @@ def get_entities(onewirehub: OneWireHub) -> list[BinarySensorEntity]:
 
         if family not in DEVICE_BINARY_SENSORS:
             continue
+        device_dir = os.path.split(device.path)[0]
         for description in DEVICE_BINARY_SENSORS[family]:
-            device_file = os.path.join(os.path.split(device.path)[0], description.key)
+            device_file = os.path.join(device_dir, description.key)
             name = f"{device_id} {description.name}"
             entities.append(
                 OneWireProxyBinarySensor(
@@ -73,10 +73,23 @@ async def async_setup_entry(hass, entry, async_add_entities):
 class OpenGarageSensor(OpenGarageEntity, SensorEntity):
     """Representation of a OpenGarage sensor."""
 
+    _device_name: str | None = None
+
+    def __init__(self, open_garage_data_coordinator, device_id, description):
+        """Initialize the sensor."""
+        super().__init__(open_garage_data_coordinator, device_id, description)
+        self._attr_device_class = description.device_class
+        self._attr_entity_category = description.entity_category
+        self._attr_native_unit_of_measurement = description.native_unit_of_measurement
+        self._attr_state_class = description.state_class
+
     @callback
     def _update_attr(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_name = (
-            f'{self.coordinator.data["name"]} {self.entity_description.key}'
-        )
-        self._attr_native_value = self.coordinator.data.get(self.entity_description.key)
+        data = self.coordinator.data
+        key = self.entity_description.key
+        # Only rebuild the name when the device has been renamed
+        if (device_name := data["name"]) != self._device_name:
+            self._device_name = device_name
+            self._attr_name = f"{device_name} {key}"
+        self._attr_native_value = data.get(key)
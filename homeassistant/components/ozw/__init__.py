@@ -66,7 +66,8 @@ async def async_setup_entry(  # noqa: C901
 
     data_nodes = {}
     hass.data[DOMAIN][NODES_VALUES] = data_values = {}
-    removed_nodes = []
+    removed_nodes = set()
+    node_schemas = {}
     manager_options = {"topic_prefix": f"{TOPIC_OPENZWAVE}/"}
 
     if entry.unique_id is None:
@@ -118,23 +119,28 @@ async def async_setup_entry(  # noqa: C901
     @callback
     def async_node_added(node):
         # Caution: This is also called on (re)start.
-        _LOGGER.debug("[NODE ADDED] node_id: %s", node.id)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("[NODE ADDED] node_id: %s", node.id)
         data_nodes[node.id] = node
         if node.id not in data_values:
-            data_values[node.id] = []
+            data_values[node.id] = {}
 
     @callback
     def async_node_changed(node):
-        _LOGGER.debug("[NODE CHANGED] node_id: %s", node.id)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("[NODE CHANGED] node_id: %s", node.id)
         data_nodes[node.id] = node
+        node_schemas.pop(node.id, None)
         # notify devices about the node change
         if node.id not in removed_nodes:
             hass.async_create_task(async_handle_node_update(hass, node))
 
     @callback
     def async_node_removed(node):
-        _LOGGER.debug("[NODE REMOVED] node_id: %s", node.id)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("[NODE REMOVED] node_id: %s", node.id)
         data_nodes.pop(node.id)
+        node_schemas.pop(node.id, None)
         # node added/removed events also happen on (re)starts of hass/mqtt/ozw
         # cleanup device/entity registry if we know this node is permanently deleted
         # entities itself are removed by the values logic
@@ -146,45 +152,54 @@ async def async_setup_entry(  # noqa: C901
     def async_instance_event(message):
         event = message["event"]
         event_data = message["data"]
-        _LOGGER.debug("[INSTANCE EVENT]: %s - data: %s", event, event_data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("[INSTANCE EVENT]: %s - data: %s", event, event_data)
         # The actual removal action of a Z-Wave node is reported as instance event
         # Only when this event is detected we cleanup the device and entities from hass
         # Note: Find a more elegant way of doing this, e.g. a notification of this event from OZW
         if event in ("removenode", "removefailednode") and "Node" in event_data:
-            removed_nodes.append(event_data["Node"])
+            removed_nodes.add(event_data["Node"])
 
     @callback
     def async_value_added(value):
         node = value.node
         # Clean up node.node_id and node.id use. They are the same.
-        node_id = value.node.node_id
+        node_id = node.node_id
+        command_class = value.command_class
 
         # Filter out CommandClasses we're definitely not interested in.
-        if value.command_class in (CommandClass.MANUFACTURER_SPECIFIC,):
+        if command_class == CommandClass.MANUFACTURER_SPECIFIC:
             return
 
-        _LOGGER.debug(
-            "[VALUE ADDED] node_id: %s - label: %s - value: %s - value_id: %s - CC: %s",
-            value.node.id,
-            value.label,
-            value.value,
-            value.value_id_key,
-            value.command_class,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[VALUE ADDED] node_id: %s - label: %s - value: %s - value_id: %s - CC: %s",
+                node.id,
+                value.label,
+                value.value,
+                value.value_id_key,
+                command_class,
+            )
 
         node_data_values = data_values[node_id]
 
         # Check if this value should be tracked by an existing entity
-        value_unique_id = create_value_id(value)
-        for values in node_data_values:
-            values.async_check_value(value)
-            if values.values_id == value_unique_id:
-                return  # this value already has an entity
+        for values_collections in node_data_values.values():
+            for values in values_collections:
+                values.async_check_value(value)
+        if create_value_id(value) in node_data_values:
+            return  # this value already has an entity
+
+        # Only the schemas matching this node need to be checked against its values
+        if (schemas := node_schemas.get(node_id)) is None:
+            schemas = node_schemas[node_id] = [
+                schema
+                for schema in DISCOVERY_SCHEMAS
+                if check_node_schema(node, schema)
+            ]
 
         # Run discovery on it and see if any entities need created
-        for schema in DISCOVERY_SCHEMAS:
-            if not check_node_schema(node, schema):
-                continue
+        for schema in schemas:
             if not check_value_schema(
                 value, schema[const.DISC_VALUES][const.DISC_PRIMARY]
             ):
@@ -192,26 +207,25 @@ async def async_setup_entry(  # noqa: C901
 
             values = ZWaveDeviceEntityValues(hass, options, schema, value)
             values.async_setup()
-
-            # This is legacy and can be cleaned up since we are in the main thread:
-            # We create a new list and update the reference here so that
-            # the list can be safely iterated over in the main thread
-            data_values[node_id] = node_data_values + [values]
+            # Several schemas can match the same primary value
+            node_data_values.setdefault(values.values_id, []).append(values)
 
     @callback
     def async_value_changed(value):
         # if an entity belonging to this value needs updating,
         # it's handled within the entity logic
-        _LOGGER.debug(
-            "[VALUE CHANGED] node_id: %s - label: %s - value: %s - value_id: %s - CC: %s",
-            value.node.id,
-            value.label,
-            value.value,
-            value.value_id_key,
-            value.command_class,
-        )
+        command_class = value.command_class
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[VALUE CHANGED] node_id: %s - label: %s - value: %s - value_id: %s - CC: %s",
+                value.node.id,
+                value.label,
+                value.value,
+                value.value_id_key,
+                command_class,
+            )
         # Handle a scene activation message
-        if value.command_class in (
+        if command_class in (
             CommandClass.SCENE_ACTIVATION,
             CommandClass.CENTRAL_SCENE,
         ):
@@ -220,22 +234,20 @@ async def async_setup_entry(  # noqa: C901
 
     @callback
     def async_value_removed(value):
-        _LOGGER.debug(
-            "[VALUE REMOVED] node_id: %s - label: %s - value: %s - value_id: %s - CC: %s",
-            value.node.id,
-            value.label,
-            value.value,
-            value.value_id_key,
-            value.command_class,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[VALUE REMOVED] node_id: %s - label: %s - value: %s - value_id: %s - CC: %s",
+                value.node.id,
+                value.label,
+                value.value,
+                value.value_id_key,
+                value.command_class,
+            )
         # signal all entities using this value for removal
         value_unique_id = create_value_id(value)
         async_dispatcher_send(hass, const.SIGNAL_DELETE_ENTITY, value_unique_id)
-        # remove value from our local list
-        node_data_values = data_values[value.node.id]
-        node_data_values[:] = [
-            item for item in node_data_values if item.values_id != value_unique_id
-        ]
+        # remove all values collections for this value from our local mapping
+        data_values[value.node.id].pop(value_unique_id, None)
 
     # Listen to events for node and value changes
     for event, event_callback in (
@@ -369,10 +381,10 @@ async def async_handle_node_update(hass: HomeAssistant, node: OZWNode):
     if not device:
         return
     # update device in device registry with (updated) info
+    dev_name = create_device_name(node)
     for item in dev_registry.devices.values():
         if device.id not in (item.id, item.via_device_id):
             continue
-        dev_name = create_device_name(node)
         dev_registry.async_update_device(
             item.id,
             manufacturer=node.node_manufacturer_name,
@@ -396,16 +408,20 @@ def async_handle_scene_activated(hass: HomeAssistant, scene_value: OZWValue):
         # central scene command
         if scene_value.type != ValueType.LIST:
             return
-        scene_value_label = scene_value.value["Selected"]
-        scene_value_id = scene_value.value["Selected_id"]
-
-    _LOGGER.debug(
-        "[SCENE_ACTIVATED] ozw_instance: %s - node_id: %s - scene_id: %s - scene_value_id: %s",
-        ozw_instance_id,
-        node_id,
-        scene_id,
-        scene_value_id,
-    )
+        selected = scene_value.value
+        if "Selected" not in selected or "Selected_id" not in selected:
+            return
+        scene_value_label = selected["Selected"]
+        scene_value_id = selected["Selected_id"]
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "[SCENE_ACTIVATED] ozw_instance: %s - node_id: %s - scene_id: %s - scene_value_id: %s",
+            ozw_instance_id,
+            node_id,
+            scene_id,
+            scene_value_id,
+        )
     # Simply forward it to the hass event bus
     hass.bus.async_fire(
         const.EVENT_SCENE_ACTIVATED,
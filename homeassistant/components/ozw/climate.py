@@ -163,14 +163,50 @@ class ZWaveClimateEntity(ZWaveDeviceEntity, ClimateEntity):
         super().__init__(values)
         self._hvac_modes = {}
         self._hvac_presets = {}
+        self._fan_mode_list = None
+        self._fan_modes = {}
+        self._attr_fan_modes = []
+        self._setpoint_values = {}
         self.on_value_update()
 
     @callback
     def on_value_update(self):
         """Call when the underlying values object changes."""
         self._current_mode_setpoint_values = self._get_current_mode_setpoint_values()
+        support = 0
+        if len(self._current_mode_setpoint_values) == 1:
+            support |= SUPPORT_TARGET_TEMPERATURE
+        elif len(self._current_mode_setpoint_values) > 1:
+            support |= SUPPORT_TARGET_TEMPERATURE_RANGE
+        if self.values.fan_mode:
+            support |= SUPPORT_FAN_MODE
+        if self.values.mode:
+            support |= SUPPORT_PRESET_MODE
+        self._attr_supported_features = support
+        if self.values.operating_state:
+            self._attr_hvac_action = HVAC_CURRENT_MAPPINGS.get(
+                self.values.operating_state.value.lower()
+            )
+        else:
+            self._attr_hvac_action = None
+        data = super().extra_state_attributes
+        if self.values.fan_action:
+            data[ATTR_FAN_ACTION] = self.values.fan_action.value
+        if valve_position := self.values.valve_position:
+            data[ATTR_VALVE_POSITION] = f"{valve_position.value} {valve_position.units}"
+        self._attr_extra_state_attributes = data
         if not self._hvac_modes:
             self._set_modes_and_presets()
+        if (
+            self.values.fan_mode
+            and (fan_mode_list := self.values.fan_mode.value[VALUE_LIST])
+            is not self._fan_mode_list
+        ):
+            self._fan_mode_list = fan_mode_list
+            self._fan_modes = {
+                entry[VALUE_LABEL]: entry[VALUE_ID] for entry in fan_mode_list
+            }
+            self._attr_fan_modes = list(self._fan_modes)
 
     @property
     def hvac_mode(self):
@@ -182,21 +218,11 @@ class ZWaveClimateEntity(ZWaveDeviceEntity, ClimateEntity):
             self.values.mode.value[VALUE_SELECTED_ID], HVAC_MODE_HEAT_COOL
         )
 
-    @property
-    def hvac_modes(self):
-        """Return the list of available hvac operation modes."""
-        return list(self._hvac_modes)
-
     @property
     def fan_mode(self):
         """Return the fan speed set."""
         return self.values.fan_mode.value[VALUE_SELECTED_LABEL]
 
-    @property
-    def fan_modes(self):
-        """Return a list of available fan modes."""
-        return [entry[VALUE_LABEL] for entry in self.values.fan_mode.value[VALUE_LIST]]
-
     @property
     def temperature_unit(self):
         """Return the unit of measurement."""
@@ -211,14 +237,6 @@ class ZWaveClimateEntity(ZWaveDeviceEntity, ClimateEntity):
             return None
         return self.values.temperature.value
 
-    @property
-    def hvac_action(self):
-        """Return the current running hvac operation if supported."""
-        if not self.values.operating_state:
-            return None
-        cur_state = self.values.operating_state.value.lower()
-        return HVAC_CURRENT_MAPPINGS.get(cur_state)
-
     @property
     def preset_mode(self):
         """Return preset operation ie. eco, away."""
@@ -229,11 +247,6 @@ class ZWaveClimateEntity(ZWaveDeviceEntity, ClimateEntity):
             return self.values.mode.value[VALUE_SELECTED_LABEL]
         return PRESET_NONE
 
-    @property
-    def preset_modes(self):
-        """Return the list of available preset operation modes."""
-        return list(self._hvac_presets)
-
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
@@ -274,7 +287,7 @@ class ZWaveClimateEntity(ZWaveDeviceEntity, ClimateEntity):
     async def async_set_fan_mode(self, fan_mode):
         """Set new target fan mode."""
         # get id for this fan_mode
-        fan_mode_value = _get_list_id(self.values.fan_mode.value[VALUE_LIST], fan_mode)
+        fan_mode_value = self._fan_modes.get(fan_mode)
         if fan_mode_value is None:
             _LOGGER.warning("Received an invalid fan mode: %s", fan_mode)
             return
@@ -308,42 +321,29 @@ class ZWaveClimateEntity(ZWaveDeviceEntity, ClimateEntity):
     @property
     def extra_state_attributes(self):
         """Return the optional state attributes."""
-        data = super().extra_state_attributes
-        if self.values.fan_action:
-            data[ATTR_FAN_ACTION] = self.values.fan_action.value
-        if self.values.valve_position:
-            data[
-                ATTR_VALVE_POSITION
-            ] = f"{self.values.valve_position.value} {self.values.valve_position.units}"
-        return data
-
-    @property
-    def supported_features(self):
-        """Return the list of supported features."""
-        support = 0
-        if len(self._current_mode_setpoint_values) == 1:
-            support |= SUPPORT_TARGET_TEMPERATURE
-        if len(self._current_mode_setpoint_values) > 1:
-            support |= SUPPORT_TARGET_TEMPERATURE_RANGE
-        if self.values.fan_mode:
-            support |= SUPPORT_FAN_MODE
-        if self.values.mode:
-            support |= SUPPORT_PRESET_MODE
-        return support
+        return self._attr_extra_state_attributes
 
     def _get_current_mode_setpoint_values(self) -> tuple:
         """Return a tuple of current setpoint Z-Wave value(s)."""
         if not self.values.mode:
+            current_mode = None
             setpoint_names = ("setpoint_heating",)
         else:
             current_mode = self.values.mode.value[VALUE_SELECTED_ID]
             setpoint_names = MODE_SETPOINT_MAPPINGS.get(current_mode, ())
+        if (setpoint_values := self._setpoint_values.get(current_mode)) is not None:
+            return setpoint_values
         # we do not want None values in our tuple so check if the value exists
-        return tuple(
-            getattr(self.values, value_name)
+        setpoint_values = tuple(
+            value
             for value_name in setpoint_names
-            if getattr(self.values, value_name, None)
+            if (value := getattr(self.values, value_name, None))
         )
+        # Setpoint values are never removed from the values collection, so once
+        # all of them are discovered the tuple for this mode can not change
+        if len(setpoint_values) == len(setpoint_names):
+            self._setpoint_values[current_mode] = setpoint_values
+        return setpoint_values
 
     def _set_modes_and_presets(self):
         """Convert Z-Wave Thermostat modes into Home Assistant modes and presets."""
@@ -364,10 +364,5 @@ class ZWaveClimateEntity(ZWaveDeviceEntity, ClimateEntity):
             all_modes[HVAC_MODE_HEAT] = None
         self._hvac_modes = all_modes
         self._hvac_presets = all_presets
-
-
-def _get_list_id(value_lst, value_lbl):
-    """Return the id for the value in the list."""
-    return next(
-        (val[VALUE_ID] for val in value_lst if val[VALUE_LABEL] == value_lbl), None
-    )
+        self._attr_hvac_modes = list(all_modes)
+        self._attr_preset_modes = list(all_presets)
@@ -47,6 +47,7 @@ class ZWaveDeviceEntityValues:
             disc_settings[const.DISC_INSTANCE] = (primary_value.instance,)
 
         self._values[const.DISC_PRIMARY] = primary_value
+        self._values_id = create_value_id(primary_value)
         self._node = primary_value.node
         self._schema[const.DISC_NODE_ID] = [self._node.node_id]
 
@@ -143,7 +144,7 @@ class ZWaveDeviceEntityValues:
     @property
     def values_id(self):
         """Identification for this values collection."""
-        return create_value_id(self.primary)
+        return self._values_id
 
 
 class ZWaveDeviceEntity(Entity):
@@ -1,5 +1,6 @@
 """Plugwise Sensor component for Home Assistant."""
 
+from functools import lru_cache
 import logging
 
 from homeassistant.components.sensor import (
@@ -43,30 +44,30 @@ from .gateway import SmileGateway
 
 _LOGGER = logging.getLogger(__name__)
 
-ATTR_TEMPERATURE = [
+ATTR_TEMPERATURE = (
     "Temperature",
     TEMP_CELSIUS,
     DEVICE_CLASS_TEMPERATURE,
     STATE_CLASS_MEASUREMENT,
-]
-ATTR_BATTERY_LEVEL = [
+)
+ATTR_BATTERY_LEVEL = (
     "Charge",
     PERCENTAGE,
     DEVICE_CLASS_BATTERY,
     STATE_CLASS_MEASUREMENT,
-]
-ATTR_ILLUMINANCE = [
+)
+ATTR_ILLUMINANCE = (
     "Illuminance",
     UNIT_LUMEN,
     DEVICE_CLASS_ILLUMINANCE,
     STATE_CLASS_MEASUREMENT,
-]
-ATTR_PRESSURE = [
+)
+ATTR_PRESSURE = (
     "Pressure",
     PRESSURE_BAR,
     DEVICE_CLASS_PRESSURE,
     STATE_CLASS_MEASUREMENT,
-]
+)
 
 TEMP_SENSOR_MAP = {
     "setpoint": ATTR_TEMPERATURE,
@@ -79,145 +80,149 @@ TEMP_SENSOR_MAP = {
 }
 
 ENERGY_SENSOR_MAP = {
-    "electricity_consumed": [
+    "electricity_consumed": (
         "Current Consumed Power",
         POWER_WATT,
         DEVICE_CLASS_POWER,
         STATE_CLASS_MEASUREMENT,
-    ],
-    "electricity_produced": [
+    ),
+    "electricity_produced": (
         "Current Produced Power",
         POWER_WATT,
         DEVICE_CLASS_POWER,
         STATE_CLASS_MEASUREMENT,
-    ],
-    "electricity_consumed_interval": [
+    ),
+    "electricity_consumed_interval": (
         "Consumed Power Interval",
         ENERGY_WATT_HOUR,
         DEVICE_CLASS_ENERGY,
         STATE_CLASS_TOTAL,
-    ],
-    "electricity_consumed_peak_interval": [
+    ),
+    "electricity_consumed_peak_interval": (
         "Consumed Power Interval",
         ENERGY_WATT_HOUR,
         DEVICE_CLASS_ENERGY,
         STATE_CLASS_TOTAL,
-    ],
-    "electricity_consumed_off_peak_interval": [
+    ),
+    "electricity_consumed_off_peak_interval": (
         "Consumed Power Interval (off peak)",
         ENERGY_WATT_HOUR,
         DEVICE_CLASS_ENERGY,
         STATE_CLASS_TOTAL,
-    ],
-    "electricity_produced_interval": [
+    ),
+    "electricity_produced_interval": (
         "Produced Power Interval",
         ENERGY_WATT_HOUR,
         DEVICE_CLASS_ENERGY,
         STATE_CLASS_TOTAL,
-    ],
-    "electricity_produced_peak_interval": [
+    ),
+    "electricity_produced_peak_interval": (
         "Produced Power Interval",
         ENERGY_WATT_HOUR,
         DEVICE_CLASS_ENERGY,
         STATE_CLASS_TOTAL,
-    ],
-    "electricity_produced_off_peak_interval": [
+    ),
+    "electricity_produced_off_peak_interval": (
         "Produced Power Interval (off peak)",
         ENERGY_WATT_HOUR,
         DEVICE_CLASS_ENERGY,
         STATE_CLASS_TOTAL,
-    ],
-    "electricity_consumed_off_peak_point": [
+    ),
+    "electricity_consumed_off_peak_point": (
         "Current Consumed Power (off peak)",
         POWER_WATT,
         DEVICE_CLASS_POWER,
         STATE_CLASS_MEASUREMENT,
-    ],
-    "electricity_consumed_peak_point": [
+    ),
+    "electricity_consumed_peak_point": (
         "Current Consumed Power",
         POWER_WATT,
         DEVICE_CLASS_POWER,
         STATE_CLASS_MEASUREMENT,
-    ],
-    "electricity_consumed_off_peak_cumulative": [
+    ),
+    "electricity_consumed_off_peak_cumulative": (
         "Cumulative Consumed Power (off peak)",
         ENERGY_KILO_WATT_HOUR,
         DEVICE_CLASS_ENERGY,
         STATE_CLASS_TOTAL_INCREASING,
-    ],
-    "electricity_consumed_peak_cumulative": [
+    ),
+    "electricity_consumed_peak_cumulative": (
         "Cumulative Consumed Power",
         ENERGY_KILO_WATT_HOUR,
         DEVICE_CLASS_ENERGY,
         STATE_CLASS_TOTAL_INCREASING,
-    ],
-    "electricity_produced_off_peak_point": [
+    ),
+    "electricity_produced_off_peak_point": (
         "Current Produced Power (off peak)",
         POWER_WATT,
         DEVICE_CLASS_POWER,
         STATE_CLASS_MEASUREMENT,
-    ],
-    "electricity_produced_peak_point": [
+    ),
+    "electricity_produced_peak_point": (
         "Current Produced Power",
         POWER_WATT,
         DEVICE_CLASS_POWER,
         STATE_CLASS_MEASUREMENT,
-    ],
-    "electricity_produced_off_peak_cumulative": [
+    ),
+    "electricity_produced_off_peak_cumulative": (
         "Cumulative Produced Power (off peak)",
         ENERGY_KILO_WATT_HOUR,
         DEVICE_CLASS_ENERGY,
         STATE_CLASS_TOTAL_INCREASING,
-    ],
-    "electricity_produced_peak_cumulative": [
+    ),
+    "electricity_produced_peak_cumulative": (
         "Cumulative Produced Power",
         ENERGY_KILO_WATT_HOUR,
         DEVICE_CLASS_ENERGY,
         STATE_CLASS_TOTAL_INCREASING,
-    ],
-    "gas_consumed_interval": [
+    ),
+    "gas_consumed_interval": (
         "Current Consumed Gas Interval",
         VOLUME_CUBIC_METERS,
         DEVICE_CLASS_GAS,
         STATE_CLASS_TOTAL,
-    ],
-    "gas_consumed_cumulative": [
+    ),
+    "gas_consumed_cumulative": (
         "Consumed Gas",
         VOLUME_CUBIC_METERS,
         DEVICE_CLASS_GAS,
         STATE_CLASS_TOTAL_INCREASING,
-    ],
-    "net_electricity_point": [
+    ),
+    "net_electricity_point": (
         "Current net Power",
         POWER_WATT,
         DEVICE_CLASS_POWER,
         STATE_CLASS_MEASUREMENT,
-    ],
-    "net_electricity_cumulative": [
+    ),
+    "net_electricity_cumulative": (
         "Cumulative net Power",
         ENERGY_KILO_WATT_HOUR,
         DEVICE_CLASS_ENERGY,
         STATE_CLASS_TOTAL,
-    ],
+    ),
 }
 
 MISC_SENSOR_MAP = {
     "battery": ATTR_BATTERY_LEVEL,
     "illuminance": ATTR_ILLUMINANCE,
-    "modulation_level": [
+    "modulation_level": (
         "Heater Modulation Level",
         PERCENTAGE,
         None,
         STATE_CLASS_MEASUREMENT,
-    ],
-    "valve_position": ["Valve Position", PERCENTAGE, None, STATE_CLASS_MEASUREMENT],
+    ),
+    "valve_position": ("Valve Position", PERCENTAGE, None, STATE_CLASS_MEASUREMENT),
     "water_pressure": ATTR_PRESSURE,
 }
 
-INDICATE_ACTIVE_LOCAL_DEVICE = [
-    "cooling_state",
-    "flame_state",
-]
+ALL_SENSOR_MAP = {**TEMP_SENSOR_MAP, **ENERGY_SENSOR_MAP, **MISC_SENSOR_MAP}
+
+INDICATE_ACTIVE_LOCAL_DEVICE = frozenset(
+    {
+        "cooling_state",
+        "flame_state",
+    }
+)
 
 CUSTOM_ICONS = {
     "gas_consumed_interval": "mdi:fire",
@@ -227,6 +232,12 @@ CUSTOM_ICONS = {
 }
 
 
+@lru_cache(maxsize=None)
+def _titleize(sensor):
+    """Return the display name part for a sensor key."""
+    return sensor.replace("_", " ").title()
+
+
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the Smile sensors from a config entry."""
     api = hass.data[DOMAIN][config_entry.entry_id]["api"]
@@ -237,11 +248,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     single_thermostat = api.single_master_thermostat()
     for dev_id, device_properties in all_devices.items():
         data = api.get_device_data(dev_id)
-        for sensor, sensor_type in {
-            **TEMP_SENSOR_MAP,
-            **ENERGY_SENSOR_MAP,
-            **MISC_SENSOR_MAP,
-        }.items():
+        for sensor, sensor_type in ALL_SENSOR_MAP.items():
             if data.get(sensor) is None:
                 continue
 
@@ -274,21 +281,18 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                     )
                 )
 
-        if single_thermostat is False:
-            for state in INDICATE_ACTIVE_LOCAL_DEVICE:
-                if state not in data:
-                    continue
-
-                entities.append(
-                    PwAuxDeviceSensor(
-                        api,
-                        coordinator,
-                        device_properties["name"],
-                        dev_id,
-                        DEVICE_STATE,
-                    )
+        if single_thermostat is False and not INDICATE_ACTIVE_LOCAL_DEVICE.isdisjoint(
+            data
+        ):
+            entities.append(
+                PwAuxDeviceSensor(
+                    api,
+                    coordinator,
+                    device_properties["name"],
+                    dev_id,
+                    DEVICE_STATE,
                 )
-                break
+            )
 
     async_add_entities(entities, True)
 
@@ -311,7 +315,7 @@ class SmileSensor(SmileGateway, SensorEntity):
         if dev_id == self._api.heater_id:
             self._entity_name = "Auxiliary"
 
-        sensorname = sensor.replace("_", " ").title()
+        sensorname = _titleize(sensor)
         self._name = f"{self._entity_name} {sensorname}"
 
         if dev_id == self._api.gateway_id:
@@ -353,6 +357,7 @@ class PwThermostatSensor(SmileSensor):
         super().__init__(api, coordinator, name, dev_id, sensor)
 
         self._icon = None
+        self._custom_icon = CUSTOM_ICONS.get(sensor)
         self._model = sensor_type[SENSOR_MAP_MODEL]
         self._unit_of_measurement = sensor_type[SENSOR_MAP_UOM]
         self._dev_class = sensor_type[SENSOR_MAP_DEVICE_CLASS]
@@ -368,7 +373,8 @@ class PwThermostatSensor(SmileSensor):
 
         if data.get(self._sensor) is not None:
             self._state = data[self._sensor]
-            self._icon = CUSTOM_ICONS.get(self._sensor, self._icon)
+            if self._custom_icon is not None:
+                self._icon = self._custom_icon
 
         self.async_write_ha_state()
 
@@ -416,6 +422,7 @@ class PwPowerSensor(SmileSensor):
         super().__init__(api, coordinator, name, dev_id, sensor)
 
         self._icon = None
+        self._custom_icon = CUSTOM_ICONS.get(sensor)
         self._model = model
         if model is None:
             self._model = sensor_type[SENSOR_MAP_MODEL]
@@ -437,6 +444,7 @@ class PwPowerSensor(SmileSensor):
 
         if data.get(self._sensor) is not None:
             self._state = data[self._sensor]
-            self._icon = CUSTOM_ICONS.get(self._sensor, self._icon)
+            if self._custom_icon is not None:
+                self._icon = self._custom_icon
 
         self.async_write_ha_state()
@@ -13,28 +13,34 @@ CONST_VENETIAN_BLIND_MODE_DEFAULT = "Unknown"
 CONST_VENETIAN_BLIND_MODE_EU = "EU"
 CONST_VENETIAN_BLIND_MODE_US = "US"
 
-COMMAND_ON_LIST = [
-    "On",
-    "Up",
-    "Stop",
-    "Group on",
-    "Open (inline relay)",
-    "Stop (inline relay)",
-    "Enable sun automation",
-]
-
-COMMAND_OFF_LIST = [
-    "Off",
-    "Group off",
-    "Down",
-    "Close (inline relay)",
-    "Disable sun automation",
-]
-
-COMMAND_GROUP_LIST = [
-    "Group on",
-    "Group off",
-]
+COMMAND_ON_LIST = frozenset(
+    {
+        "On",
+        "Up",
+        "Stop",
+        "Group on",
+        "Open (inline relay)",
+        "Stop (inline relay)",
+        "Enable sun automation",
+    }
+)
+
+COMMAND_OFF_LIST = frozenset(
+    {
+        "Off",
+        "Group off",
+        "Down",
+        "Close (inline relay)",
+        "Disable sun automation",
+    }
+)
+
+COMMAND_GROUP_LIST = frozenset(
+    {
+        "Group on",
+        "Group off",
+    }
+)
 
 ATTR_EVENT = "event"
 
@@ -29,11 +29,13 @@ _LOGGER = logging.getLogger(__name__)
 
 def supported(event):
     """Return whether an event supports switch."""
+    device = event.device
+    if isinstance(device, rfxtrxmod.RfyDevice):
+        return True
     return (
-        isinstance(event.device, rfxtrxmod.LightingDevice)
-        and not event.device.known_to_be_dimmable
-        and not event.device.known_to_be_rollershutter
-        or isinstance(event.device, rfxtrxmod.RfyDevice)
+        isinstance(device, rfxtrxmod.LightingDevice)
+        and not device.known_to_be_dimmable
+        and not device.known_to_be_rollershutter
     )
 
 
@@ -79,13 +81,14 @@ async def async_setup_entry(
             return
         device_ids.add(device_id)
 
-        _LOGGER.info(
-            "Added switch (Device ID: %s Class: %s Sub: %s, Event: %s)",
-            event.device.id_string.lower(),
-            event.device.__class__.__name__,
-            event.device.subtype,
-            "".join(f"{x:02x}" for x in event.data),
-        )
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Added switch (Device ID: %s Class: %s Sub: %s, Event: %s)",
+                event.device.id_string.lower(),
+                event.device.__class__.__name__,
+                event.device.subtype,
+                event.data.hex(),
+            )
 
         entity = RfxtrxSwitch(
             event.device, device_id, DEFAULT_SIGNAL_REPETITIONS, event=event
@@ -111,9 +114,10 @@ class RfxtrxSwitch(RfxtrxCommandEntity, SwitchEntity):
     def _apply_event(self, event):
         """Apply command from rfxtrx."""
         super()._apply_event(event)
-        if event.values["Command"] in COMMAND_ON_LIST:
+        command = event.values["Command"]
+        if command in COMMAND_ON_LIST:
             self._state = True
-        elif event.values["Command"] in COMMAND_OFF_LIST:
+        elif command in COMMAND_OFF_LIST:
             self._state = False
 
     @callback
@@ -132,11 +136,13 @@ class RfxtrxSwitch(RfxtrxCommandEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the device on."""
         await self._async_send(self._device.send_on)
-        self._state = True
-        self.async_write_ha_state()
+        if self._state is not True:
+            self._state = True
+            self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Turn the device off."""
         await self._async_send(self._device.send_off)
-        self._state = False
-        self.async_write_ha_state()
+        if self._state is not False:
+            self._state = False
+            self.async_write_ha_state()
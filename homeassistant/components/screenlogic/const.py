@@ -13,6 +13,8 @@ SUPPORTED_COLOR_MODES = {
     slugify(name): num for num, name in COLOR_MODE.NAME_FOR_NUM.items()
 }
 
-LIGHT_CIRCUIT_FUNCTIONS = {CIRCUIT_FUNCTION.INTELLIBRITE, CIRCUIT_FUNCTION.LIGHT}
+LIGHT_CIRCUIT_FUNCTIONS = frozenset(
+    {CIRCUIT_FUNCTION.INTELLIBRITE, CIRCUIT_FUNCTION.LIGHT}
+)
 
 DISCOVERED_GATEWAYS = "_discovered_gateways"
@@ -80,11 +80,7 @@ class SkybellDevice(Entity):
     def update(self):
         """Update automation state."""
         self._device.refresh()
-
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return {
+        self._attr_extra_state_attributes = {
             ATTR_ATTRIBUTION: ATTRIBUTION,
             "device_id": self._device.device_id,
             "status": self._device.status,
@@ -74,15 +74,6 @@ class SkybellBinarySensor(SkybellDevice, BinarySensorEntity):
         self._attr_name = f"{self._device.name} {description.name}"
         self._event: dict[Any, Any] = {}
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        attrs = super().extra_state_attributes
-
-        attrs["event_date"] = self._event.get("createdAt")
-
-        return attrs
-
     def update(self):
         """Get the latest data and updates the state."""
         super().update()
@@ -92,3 +83,7 @@ class SkybellBinarySensor(SkybellDevice, BinarySensorEntity):
         self._attr_is_on = bool(event and event.get("id") != self._event.get("id"))
 
         self._event = event or {}
+        self._attr_extra_state_attributes = {
+            **self._attr_extra_state_attributes,
+            "event_date": self._event.get("createdAt"),
+        }
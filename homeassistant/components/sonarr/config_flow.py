@@ -34,6 +34,22 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+REAUTH_SCHEMA = vol.Schema({vol.Required(CONF_API_KEY): str})
+
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+        vol.Required(CONF_API_KEY): str,
+        vol.Optional(CONF_BASE_PATH, default=DEFAULT_BASE_PATH): str,
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+        vol.Optional(CONF_SSL, default=DEFAULT_SSL): bool,
+    }
+)
+
+ADVANCED_USER_SCHEMA = USER_SCHEMA.extend(
+    {vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): bool}
+)
+
 
 async def validate_input(hass: HomeAssistant, data: dict) -> None:
     """Validate the user input allows us to connect.
@@ -120,10 +136,9 @@ class SonarrConfigFlow(ConfigFlow, domain=DOMAIN):
                     title=user_input[CONF_HOST], data=user_input
                 )
 
-        data_schema = self._get_user_data_schema()
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(data_schema),
+            data_schema=self._get_user_data_schema(),
             errors=errors,
         )
 
@@ -134,25 +149,15 @@ class SonarrConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_abort(reason="reauth_successful")
 
-    def _get_user_data_schema(self) -> dict[str, Any]:
+    def _get_user_data_schema(self) -> vol.Schema:
         """Get the data schema to display user form."""
         if self.entry:
-            return {vol.Required(CONF_API_KEY): str}
-
-        data_schema = {
-            vol.Required(CONF_HOST): str,
-            vol.Required(CONF_API_KEY): str,
-            vol.Optional(CONF_BASE_PATH, default=DEFAULT_BASE_PATH): str,
-            vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
-            vol.Optional(CONF_SSL, default=DEFAULT_SSL): bool,
-        }
+            return REAUTH_SCHEMA
 
         if self.show_advanced_options:
-            data_schema[
-                vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL)
-            ] = bool
+            return ADVANCED_USER_SCHEMA
 
-        return data_schema
+        return USER_SCHEMA
 
 
 class SonarrOptionsFlowHandler(OptionsFlow):
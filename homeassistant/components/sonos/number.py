@@ -1,6 +1,8 @@
 """Entity representing a Sonos number control."""
 from __future__ import annotations
 
+from operator import attrgetter
+
 from homeassistant.components.number import NumberEntity
 from homeassistant.const import ENTITY_CATEGORY_CONFIG
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
@@ -38,16 +40,9 @@ class SonosLevelEntity(SonosEntity, NumberEntity):
         """Initialize the level entity."""
         super().__init__(speaker)
         self.level_type = level_type
-
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID."""
-        return f"{self.soco.uid}-{self.level_type}"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.speaker.zone_name} {self.level_type.capitalize()}"
+        self._get_level = attrgetter(level_type)
+        self._attr_unique_id = f"{speaker.soco.uid}-{level_type}"
+        self._attr_name = f"{speaker.zone_name} {level_type.capitalize()}"
 
     async def _async_poll(self) -> None:
         """Poll the value if subscriptions are not working."""
@@ -61,4 +56,4 @@ class SonosLevelEntity(SonosEntity, NumberEntity):
     @property
     def value(self) -> float:
         """Return the current value."""
-        return getattr(self.speaker, self.level_type)
+        return self._get_level(self.speaker)
@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from datetime import timedelta
 import logging
+import re
 from typing import Any
 
 import async_timeout
@@ -81,6 +82,9 @@ CONFIG_SCHEMA = cv.deprecated(DOMAIN)
 
 ATTRIBUTION = "Data provided by Synology"
 
+DEVICE_TYPE_REPLACEMENTS = {"_": " ", "raid": "RAID", "shr": "SHR"}
+DEVICE_TYPE_RE = re.compile("|".join(DEVICE_TYPE_REPLACEMENTS))
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -146,9 +150,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # For SSDP compat
     if not entry.data.get(CONF_MAC):
-        network = await hass.async_add_executor_job(getattr, api.dsm, "network")
         hass.config_entries.async_update_entry(
-            entry, data={**entry.data, CONF_MAC: network.macs}
+            entry, data={**entry.data, CONF_MAC: api.network.macs}
         )
 
     async def async_coordinator_update_data_cameras() -> dict[
@@ -175,14 +178,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             }
         }
 
-    async def async_coordinator_update_data_central() -> None:
-        """Fetch all device and sensor data from api."""
-        try:
-            await api.async_update()
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
-        return None
-
     async def async_coordinator_update_data_switches() -> dict[
         str, dict[str, Any]
     ] | None:
@@ -214,7 +209,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass,
         _LOGGER,
         name=f"{entry.unique_id}_central",
-        update_method=async_coordinator_update_data_central,
+        update_method=api.async_update,
         update_interval=timedelta(
             minutes=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
         ),
@@ -312,6 +307,7 @@ class SynoApi:
 
         # Should we fetch them
         self._fetching_entities: dict[str, set[str]] = {}
+        self._fetching_entities_changed = True
         self._with_information = True
         self._with_security = True
         self._with_storage = True
@@ -332,11 +328,16 @@ class SynoApi:
             timeout=self._entry.options.get(CONF_TIMEOUT),
             device_token=self._entry.data.get(CONF_DEVICE_TOKEN),
         )
-        await self._hass.async_add_executor_job(self.dsm.login)
+        await self._hass.async_add_executor_job(self._setup)
+        self.initialized = True
+
+    def _setup(self) -> None:
+        """Login and fetch the initial device configuration and data."""
+        self.dsm.login()
 
         # check if surveillance station is used
-        self._with_surveillance_station = bool(
-            self.dsm.apis.get(SynoSurveillanceStation.CAMERA_API_KEY)
+        self._with_surveillance_station = (
+            SynoSurveillanceStation.CAMERA_API_KEY in self.dsm.apis
         )
         _LOGGER.debug(
             "State of Surveillance_station during setup of '%s': %s",
@@ -344,11 +345,9 @@ class SynoApi:
             self._with_surveillance_station,
         )
 
-        self._async_setup_api_requests()
-
-        await self._hass.async_add_executor_job(self._fetch_device_configuration)
-        await self.async_update()
-        self.initialized = True
+        # No entity has subscribed yet, so all APIs are fetched
+        self._fetch_device_configuration()
+        self.dsm.update(self._with_information)
 
     @callback
     def subscribe(self, api_key: str, unique_id: str) -> Callable[[], None]:
@@ -356,6 +355,7 @@ class SynoApi:
         _LOGGER.debug("Subscribe new entity: %s", unique_id)
         if api_key not in self._fetching_entities:
             self._fetching_entities[api_key] = set()
+            self._fetching_entities_changed = True
         self._fetching_entities[api_key].add(unique_id)
 
         @callback
@@ -365,6 +365,7 @@ class SynoApi:
             self._fetching_entities[api_key].remove(unique_id)
             if len(self._fetching_entities[api_key]) == 0:
                 self._fetching_entities.pop(api_key)
+                self._fetching_entities_changed = True
 
         return unsubscribe
 
@@ -381,19 +382,20 @@ class SynoApi:
         # surveillance_station is updated by own coordinator
         self.dsm.reset(self.surveillance_station)
 
+        # The fetched APIs only change when an API gains or loses all its entities
+        if not self._fetching_entities_changed:
+            return
+        self._fetching_entities_changed = False
+
         # Determine if we should fetch an API
-        self._with_system = bool(self.dsm.apis.get(SynoCoreSystem.API_KEY))
-        self._with_security = bool(
-            self._fetching_entities.get(SynoCoreSecurity.API_KEY)
-        )
-        self._with_storage = bool(self._fetching_entities.get(SynoStorage.API_KEY))
-        self._with_upgrade = bool(self._fetching_entities.get(SynoCoreUpgrade.API_KEY))
-        self._with_utilisation = bool(
-            self._fetching_entities.get(SynoCoreUtilization.API_KEY)
-        )
-        self._with_information = bool(
-            self._fetching_entities.get(SynoDSMInformation.API_KEY)
-        )
+        # API keys are removed from fetching entities once their last entity is gone
+        fetching_entities = self._fetching_entities
+        self._with_system = SynoCoreSystem.API_KEY in self.dsm.apis
+        self._with_security = SynoCoreSecurity.API_KEY in fetching_entities
+        self._with_storage = SynoStorage.API_KEY in fetching_entities
+        self._with_upgrade = SynoCoreUpgrade.API_KEY in fetching_entities
+        self._with_utilisation = SynoCoreUtilization.API_KEY in fetching_entities
+        self._with_information = SynoDSMInformation.API_KEY in fetching_entities
 
         # Reset not used API, information is not reset since it's used in device_info
         if not self._with_security:
@@ -521,6 +523,8 @@ class SynoApi:
             )
             await self._hass.config_entries.async_reload(self._entry.entry_id)
             return
+        except Exception as err:
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
 
 
 class SynologyDSMBaseEntity(CoordinatorEntity):
@@ -541,21 +545,17 @@ class SynologyDSMBaseEntity(CoordinatorEntity):
         self.entity_description = description
 
         self._api = api
+        information = api.information
+        serial = information.serial
         self._attr_name = f"{api.network.hostname} {description.name}"
-        self._attr_unique_id: str = (
-            f"{api.information.serial}_{description.api_key}:{description.key}"
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._api.information.serial)},
+        self._attr_unique_id: str = f"{serial}_{description.api_key}:{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, serial)},
             name="Synology NAS",
             manufacturer="Synology",
-            model=self._api.information.model,
-            sw_version=self._api.information.version_string,
-            configuration_url=self._api.config_url,
+            model=information.model,
+            sw_version=information.version_string,
+            configuration_url=api.config_url,
         )
 
     async def async_added_to_hass(self) -> None:
@@ -592,11 +592,8 @@ class SynologyDSMDeviceEntity(SynologyDSMBaseEntity):
             self._device_manufacturer = "Synology"
             self._device_model = self._api.information.model
             self._device_firmware = self._api.information.version_string
-            self._device_type = (
-                volume["device_type"]
-                .replace("_", " ")
-                .replace("raid", "RAID")
-                .replace("shr", "SHR")
+            self._device_type = DEVICE_TYPE_RE.sub(
+                lambda match: DEVICE_TYPE_REPLACEMENTS[match[0]], volume["device_type"]
             )
         elif "disk" in description.key:
             disk = self._api.storage.get_disk(self._device_id)
@@ -609,21 +606,17 @@ class SynologyDSMDeviceEntity(SynologyDSMBaseEntity):
             f"{self._api.network.hostname} {self._device_name} {description.name}"
         )
         self._attr_unique_id += f"_{self._device_id}"
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._api.storage  # type: ignore [no-any-return]
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._api.information.serial}_{self._device_id}")},
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{api.information.serial}_{device_id}")},
             name=f"Synology NAS ({self._device_name} - {self._device_type})",
             manufacturer=self._device_manufacturer,
             model=self._device_model,
             sw_version=self._device_firmware,
-            via_device=(DOMAIN, self._api.information.serial),
-            configuration_url=self._api.config_url,
+            via_device=(DOMAIN, api.information.serial),
+            configuration_url=api.config_url,
         )
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return self._api.storage  # type: ignore [no-any-return]
@@ -120,6 +120,9 @@ async def test_verify_code_timeout(hass):
     assert result["type"] == data_entry_flow.RESULT_TYPE_FORM
     assert result["step_id"] == "link"
     assert result["errors"] == {"code": "timeout"}
+    assert result["description_placeholders"] == {"url": "https://example.com"}
+    # The authorize url is reused when the form is shown again
+    assert gen_authorize_url.call_count == 1
 
 
 async def test_verify_code_invalid(hass):
@@ -279,6 +279,57 @@ async def test_unexpected_existing_config_entries(hass, oauth):
     }
 
 
+async def test_reauth_multiple_loaded_config_entries(hass, oauth):
+    """Test reauth removes loaded stale entries before reloading the kept one."""
+    assert await setup.async_setup_component(hass, DOMAIN, CONFIG)
+
+    for _ in range(2):
+        MockConfigEntry(
+            domain=DOMAIN, data={"auth_implementation": WEB_AUTH_DOMAIN, "sdm": {}}
+        ).add_to_hass(hass)
+
+    entries = hass.config_entries.async_entries(DOMAIN)
+    assert len(entries) == 2
+    with patch("homeassistant.components.nest.async_setup_entry", return_value=True):
+        for entry in entries:
+            assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    assert all(
+        entry.state is config_entries.ConfigEntryState.LOADED for entry in entries
+    )
+    kept_entry, stale_entry = entries
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_REAUTH}, data=kept_entry.data
+    )
+    assert result["type"] == "form"
+    assert result["step_id"] == "reauth_confirm"
+
+    flows = hass.config_entries.flow.async_progress()
+    result = await hass.config_entries.flow.async_configure(flows[0]["flow_id"], {})
+
+    with patch(
+        "homeassistant.components.nest.async_unload_entry", return_value=True
+    ) as mock_unload:
+        entry = await oauth.async_oauth_web_flow(result)
+
+    # The stale entry is unloaded on removal, then the kept entry is reloaded
+    assert len(mock_unload.mock_calls) == 2
+    assert mock_unload.mock_calls[0][1][1] is stale_entry
+    assert mock_unload.mock_calls[1][1][1] is kept_entry
+    assert stale_entry.state is config_entries.ConfigEntryState.NOT_LOADED
+    assert entry is kept_entry
+    assert entry.state is config_entries.ConfigEntryState.LOADED
+    assert entry.unique_id == DOMAIN
+    entry.data["token"].pop("expires_at")
+    assert entry.data["token"] == {
+        "refresh_token": "mock-refresh-token",
+        "access_token": "mock-access-token",
+        "type": "Bearer",
+        "expires_in": 60,
+    }
+
+
 async def test_app_full_flow(hass, oauth, aioclient_mock):
     """Check full flow."""
     assert await setup.async_setup_component(hass, DOMAIN, CONFIG)
@@ -0,0 +1,61 @@
+"""The tests for the Skybell binary sensor platform."""
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components.skybell import ATTRIBUTION, DOMAIN
+from homeassistant.const import ATTR_ATTRIBUTION
+from homeassistant.setup import async_setup_component
+
+EVENTS = {
+    "device:sensor:button": {"id": "button-1", "createdAt": "2021-12-01T10:00:00Z"},
+    "device:sensor:motion": {"id": "motion-1", "createdAt": "2021-12-01T11:00:00Z"},
+}
+
+
+def _mock_device():
+    """Return a mock Skybell device."""
+    device = MagicMock()
+    device.name = "Front Door"
+    device.device_id = "device-id"
+    device.status = "up"
+    device.location = {"lat": "0", "lng": "0"}
+    device.wifi_ssid = "wifi"
+    device.wifi_status = "good"
+    device.last_check_in = "2021-12-01T09:00:00Z"
+    device.motion_threshold = 50
+    device.video_profile = 1
+    device.latest.side_effect = EVENTS.get
+    return device
+
+
+async def test_binary_sensor_attributes(hass):
+    """Test the Skybell binary sensors expose their own event date."""
+    with patch("homeassistant.components.skybell.Skybell") as mock_skybell:
+        mock_skybell.return_value.get_devices.return_value = [_mock_device()]
+        assert await async_setup_component(
+            hass, DOMAIN, {DOMAIN: {"username": "user", "password": "pass"}}
+        )
+        assert await async_setup_component(
+            hass,
+            "binary_sensor",
+            {
+                "binary_sensor": {
+                    "platform": DOMAIN,
+                    "monitored_conditions": ["button", "motion"],
+                }
+            },
+        )
+        await hass.async_block_till_done()
+
+    button_state = hass.states.get("binary_sensor.skybell_front_door_button")
+    assert button_state is not None
+    assert button_state.state == "on"
+    assert button_state.attributes[ATTR_ATTRIBUTION] == ATTRIBUTION
+    assert button_state.attributes["device_id"] == "device-id"
+    assert button_state.attributes["wifi_ssid"] == "wifi"
+    assert button_state.attributes["event_date"] == "2021-12-01T10:00:00Z"
+
+    motion_state = hass.states.get("binary_sensor.skybell_front_door_motion")
+    assert motion_state is not None
+    assert motion_state.state == "on"
+    assert motion_state.attributes["device_id"] == "device-id"
+    assert motion_state.attributes["event_date"] == "2021-12-01T11:00:00Z"